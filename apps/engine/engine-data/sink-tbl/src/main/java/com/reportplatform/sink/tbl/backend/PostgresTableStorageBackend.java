@@ -11,6 +11,7 @@ import org.springframework.stereotype.Component;
 import org.springframework.transaction.annotation.Transactional;
 
 import java.time.OffsetDateTime;
+import java.util.ArrayList;
 import java.util.List;
 
 /**
@@ -53,7 +54,11 @@ public class PostgresTableStorageBackend implements TableStorageBackend {
         logger.info("[POSTGRES] Bulk inserting {} records for fileId={}, orgId={}, sourceType={}",
                 records.size(), fileId, orgId, sourceType);
 
-        int insertedCount = 0;
+        // Build all entities first and persist them with a single saveAll so
+        // Hibernate can group the INSERTs into JDBC batches (hibernate.jdbc.batch_size)
+        // instead of flushing one statement per record.
+        OffsetDateTime createdAt = OffsetDateTime.now();
+        List<ParsedTableEntity> entities = new ArrayList<>(records.size());
         for (TableSinkService.TableRecordData record : records) {
             try {
                 ParsedTableEntity entity = new ParsedTableEntity();
@@ -64,16 +69,16 @@ public class PostgresTableStorageBackend implements TableStorageBackend {
                 entity.setRows(objectMapper.writeValueAsString(record.rows()));
                 entity.setMetadata(objectMapper.writeValueAsString(record.metadata()));
                 entity.setStorageBackend(BACKEND_TYPE);
-                entity.setCreatedAt(OffsetDateTime.now());
-
-                parsedTableRepository.save(entity);
-                insertedCount++;
+                entity.setCreatedAt(createdAt);
+                entities.add(entity);
             } catch (JsonProcessingException e) {
                 logger.error("Failed to serialize table record for fileId={}: {}", fileId, e.getMessage());
                 throw new RuntimeException("Failed to serialize table data", e);
             }
         }
 
+        int insertedCount = parsedTableRepository.saveAll(entities).size();
+
         logger.info("[POSTGRES] Successfully inserted {} table records for fileId={}", insertedCount, fileId);
         return insertedCount;
     }
@@ -15,8 +15,16 @@ import httpx
 logger = logging.getLogger(__name__)
 
 
+class StateConflictError(Exception):
+    """Raised when a first-write save loses against a concurrent writer."""
+
+
 class DaprStateClient:
-    """Async client for Dapr state store operations."""
+    """Async client for Dapr state store operations.
+
+    A single pooled ``httpx.AsyncClient`` is reused across calls so the
+    sidecar connection stays alive instead of being re-opened per request.
+    """
 
     def __init__(
         self,
@@ -26,28 +34,73 @@ class DaprStateClient:
     ) -> None:
         self._base_url = f"http://{host}:{port}/v1.0/state/{store_name}"
         self._timeout = 10.0
+        self._client: httpx.AsyncClient | None = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled httpx client shared by all calls."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self._timeout)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the underlying httpx client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
 
     async def get_state(self, key: str) -> Any | None:
         """Retrieve a value from the state store."""
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(f"{self._base_url}/{key}")
-            if response.status_code == 204 or not response.content:
-                return None
-            response.raise_for_status()
-            return response.json()
-
-    async def save_state(self, key: str, value: Any) -> None:
-        """Save a value to the state store."""
-        payload = [
-            {
-                "key": key,
-                "value": value,
-            }
-        ]
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(
-                self._base_url,
-                content=json.dumps(payload),
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
+        client = await self._get_client()
+        response = await client.get(f"{self._base_url}/{key}")
+        if response.status_code == 204 or not response.content:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    async def get_state_with_etag(self, key: str) -> tuple[Any | None, str | None]:
+        """Retrieve a value together with its ETag for optimistic concurrency."""
+        client = await self._get_client()
+        response = await client.get(f"{self._base_url}/{key}")
+        if response.status_code == 204 or not response.content:
+            return None, None
+        response.raise_for_status()
+        return response.json(), response.headers.get("ETag")
+
+    async def save_state(
+        self,
+        key: str,
+        value: Any,
+        etag: str | None = None,
+        first_write: bool = False,
+    ) -> None:
+        """Save a value to the state store.
+
+        Args:
+            key: State key.
+            value: JSON-serialisable value.
+            etag: ETag from a previous read; the write only succeeds if the
+                stored value has not changed since.
+            first_write: Use first-write-wins concurrency. Without an ETag
+                this only succeeds if the key does not exist yet.
+
+        Raises:
+            StateConflictError: If a concurrent writer updated the key first.
+        """
+        item: dict[str, Any] = {
+            "key": key,
+            "value": value,
+        }
+        if etag is not None:
+            item["etag"] = etag
+        if first_write or etag is not None:
+            item["options"] = {"concurrency": "first-write"}
+
+        client = await self._get_client()
+        response = await client.post(
+            self._base_url,
+            content=json.dumps([item]),
+            headers={"Content-Type": "application/json"},
+        )
+        if response.status_code == 409:
+            raise StateConflictError(f"Concurrent update of state key '{key}'")
+        response.raise_for_status()
@@ -34,7 +34,11 @@ class EmbeddingResult:
 
 
 class LiteLLMClient:
-    """Async wrapper around the LiteLLM OpenAI-compatible API."""
+    """Async wrapper around the LiteLLM OpenAI-compatible API.
+
+    Keeps one pooled ``httpx.AsyncClient`` for the lifetime of the instance
+    so keep-alive connections to the gateway are reused between calls.
+    """
 
     def __init__(
         self,
@@ -48,6 +52,19 @@ class LiteLLMClient:
             "Content-Type": "application/json",
         }
         self._timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled httpx client shared by all calls."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self._timeout)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the underlying httpx client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
 
     async def chat_completion(
         self,
@@ -67,13 +84,13 @@ class LiteLLMClient:
         if response_format is not None:
             payload["response_format"] = response_format
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(
-                f"{self._base_url}/v1/chat/completions",
-                headers=self._headers,
-                json=payload,
-            )
-            response.raise_for_status()
+        client = await self._get_client()
+        response = await client.post(
+            f"{self._base_url}/v1/chat/completions",
+            headers=self._headers,
+            json=payload,
+        )
+        response.raise_for_status()
 
         data = response.json()
         usage = data.get("usage", {})
@@ -96,13 +113,13 @@ class LiteLLMClient:
             "input": text,
         }
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(
-                f"{self._base_url}/v1/embeddings",
-                headers=self._headers,
-                json=payload,
-            )
-            response.raise_for_status()
+        client = await self._get_client()
+        response = await client.post(
+            f"{self._base_url}/v1/embeddings",
+            headers=self._headers,
+            json=payload,
+        )
+        response.raise_for_status()
 
         data = response.json()
         usage = data.get("usage", {})
@@ -36,6 +36,8 @@ class AiGatewayGrpcService(ai_pb2_grpc.AiGatewayServiceServicer):
             from src.common.config import Settings
             settings = Settings()
 
+        self._llm_client: LiteLLMClient | None = None
+        self._dapr_client: DaprStateClient | None = None
         if ai_service is None:
             llm_client = LiteLLMClient(
                 base_url=settings.litellm_base_url,
@@ -61,12 +63,21 @@ class AiGatewayGrpcService(ai_pb2_grpc.AiGatewayServiceServicer):
                 model_semantic=settings.model_semantic,
                 model_embedding=settings.model_embedding,
             )
+            self._llm_client = llm_client
+            self._dapr_client = dapr_client
 
         self._ai = ai_service
         self._quota = quota_service or QuotaService(
             monthly_token_quota=settings.default_monthly_token_quota,
         )
 
+    async def close(self) -> None:
+        """Close the HTTP clients created by this servicer."""
+        if self._llm_client is not None:
+            await self._llm_client.close()
+        if self._dapr_client is not None:
+            await self._dapr_client.close()
+
     async def _check_quota(self, org_id: str, context: grpc.aio.ServicerContext) -> bool:
         """Check quota and abort with RESOURCE_EXHAUSTED if exceeded."""
         if await self._quota.is_exceeded(org_id):
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
+from typing import Final
 
-from src.atomizers.ai.client.dapr_client import DaprStateClient
+from src.atomizers.ai.client.dapr_client import DaprStateClient, StateConflictError
 from src.atomizers.ai.models.quota import QuotaStatus
 
 logger = logging.getLogger(__name__)
 
+# Read-modify-write attempts before a quota update is given up on
+_MAX_WRITE_ATTEMPTS: Final[int] = 5
+
 
 class QuotaService:
     """Manages per-org monthly token quotas."""
@@ -53,16 +57,32 @@ class QuotaService:
     async def record_usage(self, org_id: str, user_id: str, tokens_used: int, model: str) -> QuotaStatus:
         """Record token usage and return updated quota status."""
         key = self._quota_key(org_id)
-        state = await self._state.get_state(key)
-
-        current_used = state.get("tokens_used", 0) if isinstance(state, dict) else 0
-        new_used = current_used + tokens_used
 
-        await self._state.save_state(key, {
-            "tokens_used": new_used,
-            "last_user_id": user_id,
-            "last_model": model,
-        })
+        # Optimistic concurrency: the save is conditional on the ETag read
+        # (or on the key still being absent), so two workers recording usage
+        # for the same org cannot overwrite each other's increment.
+        for attempt in range(1, _MAX_WRITE_ATTEMPTS + 1):
+            state, etag = await self._state.get_state_with_etag(key)
+
+            current_used = state.get("tokens_used", 0) if isinstance(state, dict) else 0
+            new_used = current_used + tokens_used
+
+            try:
+                await self._state.save_state(
+                    key,
+                    {
+                        "tokens_used": new_used,
+                        "last_user_id": user_id,
+                        "last_model": model,
+                    },
+                    etag=etag,
+                    first_write=True,
+                )
+                break
+            except StateConflictError:
+                if attempt == _MAX_WRITE_ATTEMPTS:
+                    raise
+                logger.debug("Quota update conflict for org=%s, retrying (%d)", org_id, attempt)
 
         logger.info(
             "Recorded %d tokens for org=%s user=%s model=%s (total=%d/%d)",
@@ -28,6 +28,17 @@ DELIMITERS = [",", ";", "|", "\t"]
 # Supported encodings
 ENCODINGS = ["utf-8", "windows-1250", "iso-8859-2", "cp1250"]
 
+# Placeholders pandas' default na_values treats as missing. Cells are read
+# with na_filter=False, so type detection skips these itself.
+_NA_TOKENS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+})
+
+# Whole-value dates: ISO, DD.MM.YYYY or DD/MM/YYYY
+_DATE_RE = re.compile(r"^(?:\d{4}-\d{2}-\d{2}|\d{2}\.\d{2}\.\d{4}|\d{2}/\d{2}/\d{4})$")
+
 
 @dataclass
 class CsvParsingResult:
@@ -61,16 +72,27 @@ class CsvParser:
         delimiter = self._detect_delimiter(content)
         logger.info("Detected delimiter: %r", delimiter)
 
+        # Cells are read as plain strings: the result rows are ``list[str]``
+        # and types are voted on separately, so pandas' per-cell dtype and
+        # NA inference would be wasted work (and turn cells into floats/NaN).
         try:
             df = pd.read_csv(
                 io.StringIO(content),
                 delimiter=delimiter,
                 header="infer",
                 encoding=encoding,
+                dtype=str,
+                na_filter=False,
             )
         except Exception as e:
             logger.error("Failed to parse CSV with detected settings: %s", e)
-            df = pd.read_csv(io.StringIO(content), delimiter=",", encoding=encoding)
+            df = pd.read_csv(
+                io.StringIO(content),
+                delimiter=",",
+                encoding=encoding,
+                dtype=str,
+                na_filter=False,
+            )
             delimiter = ","
 
         headers = list(df.columns) if df.columns.tolist() else []
@@ -148,36 +170,21 @@ class CsvParser:
 
     def _detect_single_column_type(self, series: pd.Series) -> str:
         """Detect the data type for a single column."""
-        non_null = series.dropna()
+        non_null = series[~series.str.strip().isin(_NA_TOKENS)]
         if len(non_null) == 0:
             return "STRING"
 
-        sample_values = non_null.head(100).astype(str).tolist()
+        sample = non_null.head(100)
 
-        try:
-            numeric_count = 0
-            for val in sample_values:
-                val_clean = val.replace(",", ".").replace(" ", "")
-                float(val_clean)
-                numeric_count += 1
-
-            if numeric_count / len(sample_values) > 0.8:
-                return "NUMBER"
-        except ValueError:
-            pass
-
-        date_patterns = [
-            r"^\d{4}-\d{2}-\d{2}$",
-            r"^\d{2}\.\d{2}\.\d{4}$",
-            r"^\d{2}/\d{2}/\d{4}$",
-        ]
-
-        date_count = 0
-        for val in sample_values:
-            for pattern in date_patterns:
-                if re.match(pattern, val):
-                    date_count += 1
-                    break
+        # A column is numeric only if every sampled value parses; one
+        # vectorized coercion replaces a per-value float() probe.
+        cleaned = sample.str.replace(",", ".", regex=False).str.replace(" ", "", regex=False)
+        if pd.to_numeric(cleaned, errors="coerce").notna().all():
+            return "NUMBER"
+
+        sample_values = sample.tolist()
+
+        date_count = sum(1 for v in sample_values if _DATE_RE.match(v))
 
         if date_count / len(sample_values) > 0.8:
             return "DATE"
@@ -11,6 +11,7 @@ from __future__ import annotations
 import io
 import logging
 from dataclasses import dataclass
+from statistics import fmean
 from typing import Any
 
 import pdfplumber
@@ -134,12 +135,11 @@ class PdfParser:
                 pil_image, lang=self._ocr_language, output_type=pytesseract.Output.DICT
             )
 
-            confidences = [
-                int(conf)
-                for conf in data["conf"]
-                if conf != "-1"
-            ]
-            avg_confidence = sum(confidences) / len(confidences) / 100.0 if confidences else 0.0
+            # Tesseract reports -1 for non-word boxes; depending on the
+            # version the values arrive as str, int or float, so compare
+            # numerically rather than against the string "-1"
+            confidences = [conf for conf in map(float, data["conf"]) if conf >= 0]
+            avg_confidence = fmean(confidences) / 100.0 if confidences else 0.0
 
             logger.info(
                 "OCR completed for page, confidence: %.2f, text length: %d",
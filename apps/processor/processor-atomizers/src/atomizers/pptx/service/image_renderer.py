@@ -9,8 +9,9 @@ import asyncio
 import logging
 import shutil
 import tempfile
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final
 
 if TYPE_CHECKING:
     from src.common.config import Settings
@@ -18,6 +19,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 _LIBREOFFICE_TIMEOUT: Final[int] = 60  # seconds
+# How long a failed LibreOffice conversion of a file is remembered
+_FAILED_CONVERSION_TTL: Final[float] = 60.0  # seconds
+
+
+class _ConversionError(RuntimeError):
+    """LibreOffice could not convert the deck at all (as opposed to one slide)."""
 
 
 class ImageRenderer:
@@ -35,13 +42,17 @@ class ImageRenderer:
     def __init__(self, settings: "Settings") -> None:
         self._settings = settings
         self._libreoffice_available: bool | None = None
+        # pptx path -> monotonic time of the last failed LibreOffice conversion
+        self._failed_conversions: dict[Path, float] = {}
 
-    async def render_slide(self, pptx_path: str | Path, slide_index: int) -> bytes:
+    async def render_slide(self, pptx_path: str | Path, slide_index: int, prs: Any = None) -> bytes:
         """Render a single slide as a PNG image.
 
         Args:
             pptx_path: Path to the local PPTX file.
             slide_index: Zero-based index of the slide to render.
+            prs: The deck already opened by the caller, if any. Batch callers
+                pass it so the fallback does not re-parse the file per slide.
 
         Returns:
             PNG image bytes.
@@ -51,17 +62,22 @@ class ImageRenderer:
         """
         pptx_path = Path(pptx_path)
 
-        if await self._is_libreoffice_available():
+        if await self._is_libreoffice_available() and not self._recently_failed(pptx_path):
             try:
                 return await self._render_with_libreoffice(pptx_path, slide_index)
-            except Exception:
+            except Exception as exc:
+                if isinstance(exc, (_ConversionError, TimeoutError)):
+                    # The whole conversion failed: send the remaining slides of
+                    # the same deck straight to the fallback instead of
+                    # re-running (and possibly timing out) it each time.
+                    self._remember_failed_conversion(pptx_path)
                 logger.warning(
                     "LibreOffice rendering failed for slide %d, falling back to Pillow",
                     slide_index,
                     exc_info=True,
                 )
 
-        return self._render_fallback(pptx_path, slide_index)
+        return self._render_fallback(pptx_path, slide_index, prs)
 
     # -- LibreOffice rendering ---------------------------------------------
 
@@ -87,7 +103,7 @@ class ImageRenderer:
             stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=_LIBREOFFICE_TIMEOUT)
 
             if proc.returncode != 0:
-                raise RuntimeError(
+                raise _ConversionError(
                     f"LibreOffice exited with code {proc.returncode}: {stderr.decode(errors='replace')}"
                 )
 
@@ -95,7 +111,7 @@ class ImageRenderer:
             png_files = sorted(tmpdir_path.glob("*.png"))
 
             if not png_files:
-                raise RuntimeError("LibreOffice produced no PNG output")
+                raise _ConversionError("LibreOffice produced no PNG output")
 
             if len(png_files) == 1:
                 target = png_files[0]
@@ -114,14 +130,16 @@ class ImageRenderer:
 
     # -- Fallback rendering ------------------------------------------------
 
-    def _render_fallback(self, pptx_path: Path, slide_index: int) -> bytes:
+    def _render_fallback(self, pptx_path: Path, slide_index: int, prs: Any = None) -> bytes:
         """Basic fallback rendering using Pillow."""
         from io import BytesIO
 
         from PIL import Image, ImageDraw, ImageFont
-        from pptx import Presentation
 
-        prs = Presentation(str(pptx_path))
+        if prs is None:
+            from pptx import Presentation
+
+            prs = Presentation(str(pptx_path))
         if slide_index < 0 or slide_index >= len(prs.slides):
             raise IndexError(f"Slide index {slide_index} out of range")
 
@@ -184,6 +202,25 @@ class ImageRenderer:
         img.save(buf, format="PNG")
         return buf.getvalue()
 
+    def _recently_failed(self, pptx_path: Path) -> bool:
+        """Return True if LibreOffice failed on this file within the TTL."""
+        failed_at = self._failed_conversions.get(pptx_path)
+        return failed_at is not None and time.monotonic() - failed_at < _FAILED_CONVERSION_TTL
+
+    def _remember_failed_conversion(self, pptx_path: Path) -> None:
+        """Record a failed conversion and drop entries past the TTL.
+
+        Every request renders its own temp file, so a path is never looked up
+        again once its request ends; expired entries are pruned here instead.
+        """
+        now = time.monotonic()
+        self._failed_conversions = {
+            path: failed_at
+            for path, failed_at in self._failed_conversions.items()
+            if now - failed_at < _FAILED_CONVERSION_TTL
+        }
+        self._failed_conversions[pptx_path] = now
+
     async def _is_libreoffice_available(self) -> bool:
         """Check whether LibreOffice is available on the system."""
         if self._libreoffice_available is not None:
@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 import re
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 
 from src.atomizers.pptx.service.pptx_parser import TableDataParsed, TableRowData, TextBlockData
@@ -21,6 +22,11 @@ _MIN_TABLE_ROWS = 2
 # Minimum number of columns to consider something a table
 _MIN_TABLE_COLS = 2
 
+# Markdown separator cell, e.g. ``---``, ``:--`` or ``:-:``
+_PIPE_SEPARATOR_RE = re.compile(r"-+:?|:?-+:?")
+# Column gap in space-aligned text (2+ whitespace characters)
+_MULTISPACE_RE = re.compile(r"\s{2,}")
+
 
 @dataclass(slots=True)
 class _CandidateTable:
@@ -133,11 +139,10 @@ class MetaTableDetector:
         if not col_counts or max(col_counts) < _MIN_TABLE_COLS:
             return None
 
-        most_common_count = max(set(col_counts), key=col_counts.count)
+        most_common_count, matching = _most_common_count(col_counts)
         if most_common_count < _MIN_TABLE_COLS:
             return None
 
-        matching = sum(1 for c in col_counts if c == most_common_count)
         consistency = matching / len(col_counts)
         if consistency < 0.7:
             return None
@@ -175,7 +180,7 @@ class MetaTableDetector:
         for line in pipe_lines:
             stripped = line.strip().strip("|")
             parts = [cell.strip() for cell in stripped.split("|")]
-            if all(re.fullmatch(r"-+:?|:?-+:?", p) for p in parts if p):
+            if all(_PIPE_SEPARATOR_RE.fullmatch(p) for p in parts if p):
                 continue
             split_lines.append(parts)
 
@@ -183,11 +188,10 @@ class MetaTableDetector:
             return None
 
         col_counts = [len(p) for p in split_lines]
-        most_common = max(set(col_counts), key=col_counts.count)
+        most_common, matching = _most_common_count(col_counts)
         if most_common < _MIN_TABLE_COLS:
             return None
 
-        matching = sum(1 for c in col_counts if c == most_common)
         consistency = matching / len(col_counts)
 
         valid = [p for p in split_lines if len(p) == most_common]
@@ -209,18 +213,16 @@ class MetaTableDetector:
     @staticmethod
     def _try_multispace(lines: list[str]) -> _CandidateTable | None:
         """Detect tables where columns are separated by 2+ spaces."""
-        pattern = re.compile(r"\s{2,}")
-        split_lines = [pattern.split(line.strip()) for line in lines]
+        split_lines = [_MULTISPACE_RE.split(line.strip()) for line in lines]
         col_counts = [len(parts) for parts in split_lines]
 
         if not col_counts or max(col_counts) < _MIN_TABLE_COLS:
             return None
 
-        most_common = max(set(col_counts), key=col_counts.count)
+        most_common, matching = _most_common_count(col_counts)
         if most_common < _MIN_TABLE_COLS:
             return None
 
-        matching = sum(1 for c in col_counts if c == most_common)
         consistency = matching / len(col_counts)
         if consistency < 0.75:
             return None
@@ -241,6 +243,17 @@ class MetaTableDetector:
         )
 
 
+def _most_common_count(col_counts: list[int]) -> tuple[int, int]:
+    """Return the most frequent column count and how many lines have it.
+
+    Frequencies are tallied once instead of calling ``list.count`` per
+    distinct value; ties resolve in set order, as before.
+    """
+    frequency = Counter(col_counts)
+    most_common = max(set(col_counts), key=frequency.__getitem__)
+    return most_common, frequency[most_common]
+
+
 def _compute_confidence(consistency: float, col_count: int, row_count: int) -> float:
     """Compute a confidence score for a candidate table."""
     score = consistency * 0.6
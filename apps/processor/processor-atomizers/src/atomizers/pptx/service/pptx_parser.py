@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import io
 import logging
+import sys
 import uuid
 from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 import openpyxl
 from pptx import Presentation
@@ -22,6 +23,15 @@ from pptx.util import Emu
 
 logger = logging.getLogger(__name__)
 
+# Cell texts up to this length are interned: tables repeat short labels,
+# units and placeholders ("-", "N/A", category names) across many rows
+_MAX_INTERNED_CELL_LEN: Final[int] = 64
+
+
+def _cell_text(text: str) -> str:
+    """Return ``text``, interned when short enough to be a repeated label."""
+    return sys.intern(text) if len(text) <= _MAX_INTERNED_CELL_LEN else text
+
 
 # ---------------------------------------------------------------------------
 # Data classes for parsed output
@@ -213,12 +223,28 @@ class PptxParser:
             raise IndexError(f"Slide index {slide_index} out of range (0..{len(prs.slides) - 1})")
 
         slide = prs.slides[slide_index]
-        texts = self._extract_text_blocks(slide)
-        tables = self._extract_tables(slide)
-        notes = self._extract_notes(slide)
+        texts: list[TextBlockData] = []
+        tables: list[TableDataParsed] = []
+        embedded_tables: list[TableDataParsed] = []
 
-        # Extract tables from embedded Excel workbooks (OLE objects)
-        embedded_tables = self._extract_embedded_excel_tables(slide, slide_index)
+        # Walk the shape tree once; each pass over slide.shapes re-creates the
+        # shape proxies from the slide XML
+        for shape in slide.shapes:
+            if shape.has_text_frame:
+                block = self._text_block_from_shape(shape)
+                if block is not None:
+                    texts.append(block)
+            if shape.has_table:
+                table = self._table_from_shape(shape)
+                if table is not None:
+                    tables.append(table)
+            # Tables from embedded Excel workbooks (OLE objects)
+            if shape.shape_type == MSO_SHAPE_TYPE.EMBEDDED_OLE_OBJECT:
+                embedded_tables.extend(
+                    self._embedded_excel_tables_from_shape(slide, shape, slide_index)
+                )
+
+        notes = self._extract_notes(slide)
         tables.extend(embedded_tables)
 
         return SlideContent(
@@ -243,74 +269,54 @@ class PptxParser:
         return ""
 
     @staticmethod
-    def _extract_text_blocks(slide: Any) -> list[TextBlockData]:
-        """Extract text blocks with position data from all shapes."""
-        blocks: list[TextBlockData] = []
-
-        for shape in slide.shapes:
-            if not shape.has_text_frame:
-                continue
-
-            text = shape.text_frame.text.strip()
-            if not text:
-                continue
-
-            is_title = False
-            if hasattr(shape, "placeholder_format") and shape.placeholder_format is not None:
-                is_title = shape.placeholder_format.idx in (0, 1)
-
-            pos_x = int(shape.left) if shape.left is not None else 0
-            pos_y = int(shape.top) if shape.top is not None else 0
-
-            blocks.append(
-                TextBlockData(
-                    shape_name=shape.name or "",
-                    text=text,
-                    is_title=is_title,
-                    position_x=pos_x,
-                    position_y=pos_y,
-                )
-            )
-
-        return blocks
+    def _text_block_from_shape(shape: Any) -> TextBlockData | None:
+        """Build a text block with position data from a text-frame shape."""
+        text = shape.text_frame.text.strip()
+        if not text:
+            return None
+
+        is_title = False
+        if hasattr(shape, "placeholder_format") and shape.placeholder_format is not None:
+            is_title = shape.placeholder_format.idx in (0, 1)
+
+        pos_x = int(shape.left) if shape.left is not None else 0
+        pos_y = int(shape.top) if shape.top is not None else 0
+
+        return TextBlockData(
+            shape_name=shape.name or "",
+            text=text,
+            is_title=is_title,
+            position_x=pos_x,
+            position_y=pos_y,
+        )
 
     @staticmethod
-    def _extract_tables(slide: Any) -> list[TableDataParsed]:
-        """Extract native tables from slide shapes."""
-        tables: list[TableDataParsed] = []
-
-        for shape in slide.shapes:
-            if not shape.has_table:
-                continue
-
-            table = shape.table
-            if table.rows is None or len(table.rows) == 0:
+    def _table_from_shape(shape: Any) -> TableDataParsed | None:
+        """Convert a native table shape into parsed table data."""
+        table = shape.table
+        if table.rows is None or len(table.rows) == 0:
+            return None
+
+        header_row = table.rows[0]
+        headers: list[str] = []
+        for cell in header_row.cells:
+            headers.append(_cell_text(cell.text.strip()))
+
+        rows: list[TableRowData] = []
+        for row_idx, row in enumerate(table.rows):
+            if row_idx == 0:
                 continue
+            cells: list[str] = []
+            for cell in row.cells:
+                cells.append(_cell_text(cell.text.strip()))
+            rows.append(TableRowData(cells=cells))
 
-            header_row = table.rows[0]
-            headers: list[str] = []
-            for cell in header_row.cells:
-                headers.append(cell.text.strip())
-
-            rows: list[TableRowData] = []
-            for row_idx, row in enumerate(table.rows):
-                if row_idx == 0:
-                    continue
-                cells: list[str] = []
-                for cell in row.cells:
-                    cells.append(cell.text.strip())
-                rows.append(TableRowData(cells=cells))
-
-            tables.append(
-                TableDataParsed(
-                    table_id=str(uuid.uuid4()),
-                    headers=headers,
-                    rows=rows,
-                    confidence=1.0,
-                )
-            )
-
-        return tables
+        return TableDataParsed(
+            table_id=str(uuid.uuid4()),
+            headers=headers,
+            rows=rows,
+            confidence=1.0,
+        )
 
     @staticmethod
     def _extract_notes(slide: Any) -> str:
@@ -343,67 +349,66 @@ class PptxParser:
         return props
 
     @staticmethod
-    def _extract_embedded_excel_tables(slide: Any, slide_index: int) -> list[TableDataParsed]:
-        """Extract tables from Excel workbooks embedded as OLE objects in the slide.
+    def _embedded_excel_tables_from_shape(
+        slide: Any, shape: Any, slide_index: int
+    ) -> list[TableDataParsed]:
+        """Extract tables from an Excel workbook embedded as an OLE object.
 
         PowerPoint stores embedded Excel objects as relationships on the slide part.
-        Each OLE object with an Excel content type is opened with openpyxl and every
+        An OLE object with an Excel content type is opened with openpyxl and every
         non-empty worksheet becomes a ``TableDataParsed`` entry.
 
         Args:
-            slide: A python-pptx Slide object.
+            slide: A python-pptx Slide object owning the shape.
+            shape: The embedded OLE object shape.
             slide_index: Zero-based slide index (used for table_id generation).
 
         Returns:
-            List of ``TableDataParsed`` extracted from all embedded workbooks.
+            List of ``TableDataParsed`` extracted from the embedded workbook.
         """
         tables: list[TableDataParsed] = []
 
-        for shape in slide.shapes:
-            if shape.shape_type != MSO_SHAPE_TYPE.EMBEDDED_OLE_OBJECT:
-                continue
-
-            try:
-                # Access the slide part's relationship for the OLE object
-                slide_part = slide._part
-                sp_elem = shape._element
-
-                # Find the oleObj XML element that holds the relationship ID
-                from pptx.oxml.ns import qn as pptx_qn
-                ole_elem = sp_elem.find(".//" + pptx_qn("p:oleObj"))
-                if ole_elem is None:
-                    continue
-
-                # Relationship ID is stored as an r:id attribute
-                r_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
-                r_id = ole_elem.get(f"{{{r_ns}}}id")
-                if not r_id:
-                    continue
-
-                ole_part = slide_part.related_part(r_id)
-                content_type = ole_part.content_type or ""
-
-                # Only process Excel workbooks
-                if "spreadsheet" not in content_type and "excel" not in content_type.lower():
-                    continue
-
-                excel_bytes = ole_part.blob
-                wb = openpyxl.load_workbook(io.BytesIO(excel_bytes), data_only=True, read_only=False)
-
-                for sheet_idx, sheet_name in enumerate(wb.sheetnames):
-                    ws = wb[sheet_name]
-                    sheet_tables = _extract_sheet_as_table(ws, sheet_name, slide_index, sheet_idx)
-                    tables.extend(sheet_tables)
-
-                wb.close()
-
-            except Exception as exc:
-                logger.warning(
-                    "Failed to extract embedded Excel from slide %d shape '%s': %s",
-                    slide_index,
-                    getattr(shape, "name", "?"),
-                    exc,
-                )
+        try:
+            # Access the slide part's relationship for the OLE object
+            slide_part = slide._part
+            sp_elem = shape._element
+
+            # Find the oleObj XML element that holds the relationship ID
+            from pptx.oxml.ns import qn as pptx_qn
+            ole_elem = sp_elem.find(".//" + pptx_qn("p:oleObj"))
+            if ole_elem is None:
+                return []
+
+            # Relationship ID is stored as an r:id attribute
+            r_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+            r_id = ole_elem.get(f"{{{r_ns}}}id")
+            if not r_id:
+                return []
+
+            ole_part = slide_part.related_part(r_id)
+            content_type = ole_part.content_type or ""
+
+            # Only process Excel workbooks
+            if "spreadsheet" not in content_type and "excel" not in content_type.lower():
+                return []
+
+            excel_bytes = ole_part.blob
+            wb = openpyxl.load_workbook(io.BytesIO(excel_bytes), data_only=True, read_only=False)
+
+            for sheet_idx, sheet_name in enumerate(wb.sheetnames):
+                ws = wb[sheet_name]
+                sheet_tables = _extract_sheet_as_table(ws, sheet_name, slide_index, sheet_idx)
+                tables.extend(sheet_tables)
+
+            wb.close()
+
+        except Exception as exc:
+            logger.warning(
+                "Failed to extract embedded Excel from slide %d shape '%s': %s",
+                slide_index,
+                getattr(shape, "name", "?"),
+                exc,
+            )
 
         return tables
 
@@ -436,7 +441,7 @@ def _extract_sheet_as_table(
             return str(value).upper()
         if isinstance(value, float) and value == int(value):
             return str(int(value))
-        return str(value)
+        return _cell_text(str(value))
 
     headers: list[str] = [
         cell_str(ws.cell(row=1, column=c).value)
@@ -7,9 +7,12 @@ collects per-slide errors for partial-success reporting.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Any, TYPE_CHECKING
+import tempfile
+from pathlib import Path
+from typing import Any, Final, TYPE_CHECKING
 
 import grpc
 
@@ -28,6 +31,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on slide images uploaded to blob storage at the same time
+_MAX_CONCURRENT_UPLOADS: Final[int] = 8
+
 
 class PptxAtomizerService(pptx_pb2_grpc.PptxAtomizerServiceServicer):
     """Async gRPC servicer for PPTX atomization.
@@ -209,7 +215,10 @@ class PptxAtomizerService(pptx_pb2_grpc.PptxAtomizerServiceServicer):
 
         async with PptxBlobClient(self._settings) as blob:
             pptx_bytes = await blob.download_pptx_bytes(request.file_id, request.blob_url)
-            pptx_path = await blob.download_pptx(request.file_id, request.blob_url)
+
+        # The renderer needs a file on disk; spill the already-downloaded
+        # bytes instead of fetching the same blob a second time.
+        pptx_path = _write_temp_pptx(pptx_bytes)
 
         prs = self._parser.open(pptx_bytes)
 
@@ -234,7 +243,6 @@ class PptxAtomizerService(pptx_pb2_grpc.PptxAtomizerServiceServicer):
         )
 
         slide_contents: list[pptx_pb2.SlideContentResponse] = []
-        slide_images: list[pptx_pb2.SlideImageResponse] = []
 
         for idx in range(structure.total_slides):
             try:
@@ -273,31 +281,12 @@ class PptxAtomizerService(pptx_pb2_grpc.PptxAtomizerServiceServicer):
                     )
                 )
 
-            try:
-                png_bytes = await self._image_renderer.render_slide(pptx_path, idx)
-
-                async with PptxBlobClient(self._settings) as blob:
-                    image_url = await blob.upload_slide_image(request.file_id, idx, png_bytes)
-
-                slide_images.append(
-                    pptx_pb2.SlideImageResponse(
-                        slide_index=idx,
-                        image=common_pb2.BlobReference(
-                            blob_url=image_url,
-                            content_type="image/png",
-                            size_bytes=len(png_bytes),
-                        ),
-                    )
-                )
-            except Exception as exc:
-                logger.error("Failed to render image for slide %d: %s", idx, exc, exc_info=True)
-                errors.append(
-                    pptx_pb2.ExtractionError(
-                        slide_index=idx,
-                        error_code="IMAGE_RENDER_FAILED",
-                        error_message=str(exc),
-                    )
-                )
+        slide_images = await self._render_slide_images(
+            request.file_id, pptx_path, prs, structure.total_slides, errors
+        )
+        # Keep errors grouped per slide (content before image), as reported
+        # when each slide was rendered right after its content
+        errors.sort(key=lambda e: e.slide_index)
 
         try:
             os.unlink(pptx_path)
@@ -320,12 +309,133 @@ class PptxAtomizerService(pptx_pb2_grpc.PptxAtomizerServiceServicer):
             errors=errors,
         )
 
+    async def _render_slide_images(
+        self,
+        file_id: str,
+        pptx_path: Path,
+        prs: Any,
+        total_slides: int,
+        errors: list[pptx_pb2.ExtractionError],
+    ) -> list[pptx_pb2.SlideImageResponse]:
+        """Render every slide and upload the PNGs over a single blob client.
+
+        Rendering stays sequential (one LibreOffice process at a time); each
+        PNG is handed to a background upload as soon as it is rendered. At
+        most ``_MAX_CONCURRENT_UPLOADS`` PNGs are in flight, so memory does
+        not grow with the size of the deck.
+
+        Args:
+            file_id: File the slides belong to.
+            pptx_path: Local copy of the deck.
+            prs: The deck as already opened for content extraction; reused by
+                the renderer's fallback so the file is parsed only once.
+            total_slides: Number of slides to render.
+            errors: Per-slide error list; failed renders/uploads are appended to it.
+
+        Returns:
+            Image responses for the successfully uploaded slides, in slide order.
+        """
+        upload_slots = asyncio.Semaphore(_MAX_CONCURRENT_UPLOADS)
+        uploads: list[asyncio.Task[pptx_pb2.SlideImageResponse | None]] = []
+        blob = PptxBlobClient(self._settings)
+
+        try:
+            for idx in range(total_slides):
+                try:
+                    png_bytes = await self._image_renderer.render_slide(pptx_path, idx, prs)
+                except Exception as exc:
+                    logger.exception("Failed to render image for slide %d: %s", idx, exc)
+                    errors.append(
+                        pptx_pb2.ExtractionError(
+                            slide_index=idx,
+                            error_code="IMAGE_RENDER_FAILED",
+                            error_message=str(exc),
+                        )
+                    )
+                    continue
+
+                # Wait for a free slot before starting the upload; the slot is
+                # released by the upload itself
+                await upload_slots.acquire()
+                uploads.append(
+                    asyncio.create_task(self._upload_slide_image(blob, file_id, idx, png_bytes, upload_slots, errors))
+                )
+
+            images = await asyncio.gather(*uploads)
+        finally:
+            for upload in uploads:
+                upload.cancel()  # no-op unless rendering was interrupted
+            await self._close_blob_client(blob)
+
+        return [image for image in images if image is not None]
+
+    async def _upload_slide_image(
+        self,
+        blob: PptxBlobClient,
+        file_id: str,
+        slide_index: int,
+        png_bytes: bytes,
+        upload_slots: asyncio.Semaphore,
+        errors: list[pptx_pb2.ExtractionError],
+    ) -> pptx_pb2.SlideImageResponse | None:
+        """Upload one rendered slide PNG and release its upload slot.
+
+        Args:
+            blob: Blob client shared by all uploads of the request.
+            file_id: File the slide belongs to.
+            slide_index: Zero-based index of the slide.
+            png_bytes: Rendered PNG image.
+            upload_slots: Semaphore the caller acquired for this upload.
+            errors: Per-slide error list; a failed upload is appended to it.
+
+        Returns:
+            The image response, or ``None`` if the upload failed.
+        """
+        try:
+            image_url = await blob.upload_slide_image(file_id, slide_index, png_bytes)
+        except Exception as exc:
+            logger.exception("Failed to upload image for slide %d: %s", slide_index, exc)
+            errors.append(
+                pptx_pb2.ExtractionError(
+                    slide_index=slide_index,
+                    error_code="IMAGE_RENDER_FAILED",
+                    error_message=str(exc),
+                )
+            )
+            return None
+        finally:
+            upload_slots.release()
+
+        return pptx_pb2.SlideImageResponse(
+            slide_index=slide_index,
+            image=common_pb2.BlobReference(
+                blob_url=image_url,
+                content_type="image/png",
+                size_bytes=len(png_bytes),
+            ),
+        )
+
+    @staticmethod
+    async def _close_blob_client(blob: PptxBlobClient) -> None:
+        """Close a blob client; a failed close does not fail the finished uploads."""
+        try:
+            await blob.close()
+        except Exception as exc:
+            logger.exception("Failed to close blob client: %s", exc)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+def _write_temp_pptx(data: bytes) -> Path:
+    """Write PPTX bytes to a temporary file and return its path."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".pptx") as tmp:
+        tmp.write(memoryview(data))
+    return Path(tmp.name)
+
+
 def _tables_to_proto(
     tables: list[Any],
 ) -> list[pptx_pb2.TableData]:
@@ -10,11 +10,12 @@ metadata template is available.
 
 from __future__ import annotations
 
+import bisect
 import fnmatch
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Final
 
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 
@@ -23,11 +24,39 @@ from src.atomizers.pptx.service.pptx_parser import TableDataParsed, TableRowData
 logger = logging.getLogger(__name__)
 
 
+# Shapes whose tops differ by less than this share a row (~1.3mm)
+_ROW_TOLERANCE_EMU: Final[int] = 50000
+
+
+def _cluster_positions(sorted_values: list[int], tolerance: int) -> dict[int, int]:
+    """Group ascending positions into clusters in a single sequential pass.
+
+    A new cluster starts whenever the gap to the previous value reaches
+    ``tolerance``.
+
+    Args:
+        sorted_values: Distinct positions in ascending order.
+        tolerance: Minimum gap (EMU) that separates two clusters.
+
+    Returns:
+        Mapping of each position to its zero-based cluster index.
+    """
+    cluster_of: dict[int, int] = {}
+    cluster_idx = 0
+    prev = sorted_values[0] if sorted_values else 0
+    for value in sorted_values:
+        if value - prev >= tolerance:
+            cluster_idx += 1
+        cluster_of[value] = cluster_idx
+        prev = value
+    return cluster_of
+
+
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ShapeData:
     """Raw shape data with position and content."""
     name: str
@@ -64,14 +93,16 @@ class SpatialTableExtractor:
     - Number parsing rules
     """
 
-    def __init__(self, template: dict[str, Any]):
+    def __init__(self, template: dict[str, Any]) -> None:
         self.template = template
-        self.parsing_rules = template.get("parsing_rules", {})
-        self.number_rules = self.parsing_rules.get("number_parsing", {})
-        self.strip_patterns = self.number_rules.get("strip_patterns", ["M€", "M€", "€", " "])
-        self.wip_markers = self.number_rules.get("wip_markers", ["WIP", "N/A", "TBD", "-"])
-
-    def extract_slide(self, slide: Any, slide_def: dict) -> ExtractionResult:
+        self.parsing_rules: dict[str, Any] = template.get("parsing_rules", {})
+        self.number_rules: dict[str, Any] = self.parsing_rules.get("number_parsing", {})
+        self.strip_patterns: list[str] = self.number_rules.get("strip_patterns", ["M€", "M€", "€", " "])
+        self.wip_markers: list[str] = self.number_rules.get("wip_markers", ["WIP", "N/A", "TBD", "-"])
+        # Upper-cased once; _parse_value checks every numeric cell against it
+        self._wip_markers_upper: frozenset[str] = frozenset(m.upper() for m in self.wip_markers)
+
+    def extract_slide(self, slide: Any, slide_def: dict[str, Any]) -> ExtractionResult:
         """Extract tables and text from a slide using metadata definition.
 
         Args:
@@ -91,7 +122,7 @@ class SpatialTableExtractor:
         logger.info("After filtering: %d shapes", len(shapes))
 
         # Extract tables
-        tables = []
+        tables: list[TableDataParsed] = []
         for table_def in slide_def.get("tables", []):
             table = self._extract_table(shapes, table_def)
             if table:
@@ -109,7 +140,7 @@ class SpatialTableExtractor:
             warnings=[],
         )
 
-    def try_match_slide(self, slide: Any, slide_def: dict) -> float:
+    def try_match_slide(self, slide: Any, slide_def: dict[str, Any]) -> float:
         """Score how well a slide matches a metadata template definition.
 
         Returns confidence 0.0-1.0 based on:
@@ -162,7 +193,7 @@ class SpatialTableExtractor:
 
     def _collect_shapes(self, slide: Any) -> list[ShapeData]:
         """Collect all shapes with their position and content."""
-        shapes = []
+        shapes: list[ShapeData] = []
         for shape in slide.shapes:
             text = ""
             if shape.has_text_frame:
@@ -181,9 +212,9 @@ class SpatialTableExtractor:
             ))
         return shapes
 
-    def _filter_shapes(self, shapes: list[ShapeData], ignore_patterns: list[dict]) -> list[ShapeData]:
+    def _filter_shapes(self, shapes: list[ShapeData], ignore_patterns: list[dict[str, Any]]) -> list[ShapeData]:
         """Remove shapes matching ignore patterns."""
-        filtered = []
+        filtered: list[ShapeData] = []
         for s in shapes:
             should_ignore = False
             for pattern in ignore_patterns:
@@ -197,46 +228,60 @@ class SpatialTableExtractor:
                 filtered.append(s)
         return filtered
 
-    def _extract_table(self, shapes: list[ShapeData], table_def: dict) -> TableDataParsed | None:
+    def _extract_table(self, shapes: list[ShapeData], table_def: dict[str, Any]) -> TableDataParsed | None:
         """Extract a single table based on its metadata definition."""
-        columns = table_def.get("columns", [])
-        row_detection = table_def.get("row_detection", {})
-        table_id = table_def.get("table_id", "unknown")
-        output_sheet = table_def.get("output_sheet_name", table_id)
+        columns: list[dict[str, Any]] = table_def.get("columns", [])
+        row_detection: dict[str, Any] = table_def.get("row_detection", {})
+        table_id: str = table_def.get("table_id", "unknown")
+        output_sheet: str = table_def.get("output_sheet_name", table_id)
 
         if not columns:
             return None
 
         # Get data region
         data_region = row_detection.get("data_region", {})
-        top_boundary = data_region.get("top_emu", 0)
-        bottom_boundary = data_region.get("bottom_emu", 999999999)
+        top_boundary: int = data_region.get("top_emu", 0)
+        bottom_boundary: int = data_region.get("bottom_emu", 999999999)
+
+        # Column bounds and name patterns are fixed for the table, so resolve
+        # them once: (left_min, left_max, name_pattern or None for "*")
+        column_matchers: list[tuple[int, int, str | None]] = []
+        for col_def in columns:
+            region = col_def.get("region", {})
+            name_pattern: str = col_def.get("shape_name_pattern", "*")
+            column_matchers.append((
+                region.get("left_min_emu", 0),
+                region.get("left_max_emu", 999999999),
+                None if name_pattern == "*" else name_pattern,
+            ))
+
+        # Horizontal span covered by any column region; shapes outside it
+        # (titles, footers, side notes) cannot land in a column, so they are
+        # rejected before the per-column matching below
+        span_left = min(m[0] for m in column_matchers)
+        span_right = max(m[1] for m in column_matchers)
 
         # Collect shapes per column (within data region)
         column_shapes: list[list[ShapeData]] = [[] for _ in columns]
         for s in shapes:
-            if not s.text.strip():
+            if s.left < span_left or s.left > span_right:
                 continue
             if s.top < top_boundary or s.top > bottom_boundary:
                 continue
+            if not s.text.strip():
+                continue
 
-            # Match shape to column by x-position
-            for col_idx, col_def in enumerate(columns):
-                region = col_def.get("region", {})
-                left_min = region.get("left_min_emu", 0)
-                left_max = region.get("left_max_emu", 999999999)
-
-                # Check if shape name matches column pattern
-                name_pattern = col_def.get("shape_name_pattern", "*")
-                name_matches = fnmatch.fnmatch(s.name, name_pattern) or name_pattern == "*"
-
-                if left_min <= s.left <= left_max and name_matches:
+            # Match shape to column by x-position, then by shape name pattern
+            for col_idx, (left_min, left_max, name_pattern) in enumerate(column_matchers):
+                if not left_min <= s.left <= left_max:
+                    continue
+                if name_pattern is None or fnmatch.fnmatch(s.name, name_pattern):
                     column_shapes[col_idx].append(s)
                     break
 
         # Detect rows using the configured method
-        method = row_detection.get("method", "vertical_position")
-        multivalue_split = row_detection.get("multivalue_split", "\n")
+        method: str = row_detection.get("method", "vertical_position")
+        multivalue_split: str = row_detection.get("multivalue_split", "\n")
 
         if method == "horizontal_lines":
             rows = self._detect_rows_by_lines(shapes, column_shapes, columns,
@@ -249,7 +294,7 @@ class SpatialTableExtractor:
             return None
 
         # Build headers
-        headers = []
+        headers: list[str] = []
         for col_def in columns:
             header_pattern = col_def.get("header_text_pattern", col_def.get("id", ""))
             # Clean header: remove wildcards
@@ -267,12 +312,12 @@ class SpatialTableExtractor:
 
     def _detect_rows_by_lines(self, all_shapes: list[ShapeData],
                                column_shapes: list[list[ShapeData]],
-                               columns: list[dict],
-                               row_detection: dict,
+                               columns: list[dict[str, Any]],
+                               row_detection: dict[str, Any],
                                multivalue_split: str) -> list[list[str]]:
         """Detect rows using horizontal line separators."""
         # Find separator lines
-        sep_pattern = row_detection.get("separator_name_pattern", "Straight Connector *")
+        sep_pattern: str = row_detection.get("separator_name_pattern", "Straight Connector *")
         line_shapes = [s for s in all_shapes
                        if fnmatch.fnmatch(s.name, sep_pattern) and s.height == 0]
         line_y_positions = sorted(set(s.top for s in line_shapes))
@@ -281,74 +326,73 @@ class SpatialTableExtractor:
             # Fallback to position-based detection
             return self._detect_rows_by_position(column_shapes, columns, multivalue_split)
 
-        # Each row is between two consecutive line positions
-        rows = []
-        data_top = row_detection.get("data_region", {}).get("top_emu", 0)
-        boundaries = [data_top] + line_y_positions
-
-        for i in range(len(boundaries)):
-            y_min = boundaries[i]
-            y_max = boundaries[i + 1] if i + 1 < len(boundaries) else 999999999
-
-            row_cells = []
-            for col_idx, col_def in enumerate(columns):
-                # Find shapes in this column within this row's y-range
-                cell_texts = []
-                for s in column_shapes[col_idx]:
-                    if y_min <= s.top < y_max:
-                        cell_texts.append(s.text.strip())
-
-                # Handle multivalue: one shape may contain multiple rows
-                expanded = []
-                for t in cell_texts:
-                    if multivalue_split and multivalue_split in t:
-                        expanded.extend(t.split(multivalue_split))
+        # Each row is between two consecutive line positions. Bucket every
+        # column's shapes into its band once (bisect over the sorted line
+        # positions) instead of rescanning each column for every band.
+        data_top: int = row_detection.get("data_region", {}).get("top_emu", 0)
+        bands: list[list[list[ShapeData]]] = [
+            [[] for _ in columns] for _ in range(len(line_y_positions) + 1)
+        ]
+        for col_idx, shapes in enumerate(column_shapes):
+            for s in shapes:
+                band = bisect.bisect_right(line_y_positions, s.top)
+                if band == 0 and s.top < data_top:
+                    continue
+                bands[band][col_idx].append(s)
+
+        rows: list[list[str]] = []
+        for band_shapes in bands:
+            # Single pass per cell: the joined cell value and the non-empty
+            # values used for multivalue expansion come from the same split
+            row_cells: list[str] = []
+            expanded_cols: list[list[str]] = []
+            max_values = 1
+            for col_def, cell_shapes in zip(columns, band_shapes):
+                expanded: list[str] = []
+                values: list[str] = []
+                for s in cell_shapes:
+                    text = s.text.strip()
+                    # Handle multivalue: one shape may contain multiple rows
+                    if multivalue_split and multivalue_split in text:
+                        parts = text.split(multivalue_split)
+                        expanded.extend(parts)
+                        values.extend(parts)
                     else:
-                        expanded.append(t)
+                        expanded.append(text)
+                        if text:
+                            values.append(text)
 
                 cell_value = " ".join(expanded).strip() if expanded else ""
                 cell_value = self._parse_value(cell_value, col_def.get("data_type", "text"))
                 row_cells.append(cell_value)
+                expanded_cols.append(values)
+                max_values = max(max_values, len(values))
 
             # Skip empty rows
-            if any(c.strip() for c in row_cells):
-                # Handle multivalue expansion (one shape = multiple rows)
-                max_values = 1
-                expanded_cols: list[list[str]] = []
-                for col_idx, col_def in enumerate(columns):
-                    values = []
-                    for s in column_shapes[col_idx]:
-                        if y_min <= s.top < y_max:
-                            text = s.text.strip()
-                            if multivalue_split and multivalue_split in text:
-                                values.extend(text.split(multivalue_split))
-                            elif text:
-                                values.append(text)
-                    max_values = max(max_values, len(values))
-                    expanded_cols.append(values)
-
-                if max_values > 1:
-                    # Expand into multiple rows
-                    for v_idx in range(max_values):
-                        expanded_row = []
-                        for col_idx, col_def in enumerate(columns):
-                            vals = expanded_cols[col_idx]
-                            val = vals[v_idx] if v_idx < len(vals) else vals[0] if vals else ""
-                            val = self._parse_value(val.strip(), col_def.get("data_type", "text"))
-                            expanded_row.append(val)
-                        if any(c.strip() for c in expanded_row):
-                            rows.append(expanded_row)
-                else:
-                    rows.append(row_cells)
+            if not any(c.strip() for c in row_cells):
+                continue
+
+            if max_values > 1:
+                # Expand into multiple rows (one shape = multiple rows)
+                for v_idx in range(max_values):
+                    expanded_row: list[str] = []
+                    for col_def, vals in zip(columns, expanded_cols):
+                        val = vals[v_idx] if v_idx < len(vals) else vals[0] if vals else ""
+                        val = self._parse_value(val.strip(), col_def.get("data_type", "text"))
+                        expanded_row.append(val)
+                    if any(c.strip() for c in expanded_row):
+                        rows.append(expanded_row)
+            else:
+                rows.append(row_cells)
 
         return rows
 
     def _detect_rows_by_position(self, column_shapes: list[list[ShapeData]],
-                                  columns: list[dict],
+                                  columns: list[dict[str, Any]],
                                   multivalue_split: str) -> list[list[str]]:
         """Detect rows by grouping shapes by y-position proximity."""
         # Collect all y-positions
-        all_tops = set()
+        all_tops: set[int] = set()
         for shapes in column_shapes:
             for s in shapes:
                 all_tops.add(s.top)
@@ -356,33 +400,27 @@ class SpatialTableExtractor:
         if not all_tops:
             return []
 
-        # Cluster y-positions (within 50000 EMU = ~1.3mm tolerance)
-        sorted_tops = sorted(all_tops)
-        clusters = []
-        current_cluster = [sorted_tops[0]]
-        for y in sorted_tops[1:]:
-            if y - current_cluster[-1] < 50000:
-                current_cluster.append(y)
-            else:
-                clusters.append(current_cluster)
-                current_cluster = [y]
-        clusters.append(current_cluster)
-
-        rows = []
-        for cluster in clusters:
-            y_min = min(cluster) - 25000
-            y_max = max(cluster) + 25000
-
-            row_cells = []
-            for col_idx, col_def in enumerate(columns):
-                cell_texts = []
-                for s in column_shapes[col_idx]:
-                    if y_min <= s.top <= y_max:
-                        text = s.text.strip()
-                        if multivalue_split and multivalue_split in text:
-                            cell_texts.extend(text.split(multivalue_split))
-                        elif text:
-                            cell_texts.append(text)
+        # Every distinct top maps to exactly one cluster, so shapes can be
+        # bucketed into rows in a single pass instead of rescanning each
+        # column for every cluster.
+        row_of_top = _cluster_positions(sorted(all_tops), _ROW_TOLERANCE_EMU)
+        row_count = row_of_top[max(all_tops)] + 1
+
+        # grid[row][col] -> text fragments, in original shape order
+        grid: list[list[list[str]]] = [[[] for _ in columns] for _ in range(row_count)]
+        for col_idx, shapes in enumerate(column_shapes):
+            for s in shapes:
+                text = s.text.strip()
+                cell_texts = grid[row_of_top[s.top]][col_idx]
+                if multivalue_split and multivalue_split in text:
+                    cell_texts.extend(text.split(multivalue_split))
+                elif text:
+                    cell_texts.append(text)
+
+        rows: list[list[str]] = []
+        for row_texts in grid:
+            row_cells: list[str] = []
+            for col_def, cell_texts in zip(columns, row_texts):
                 cell_value = cell_texts[0] if len(cell_texts) == 1 else " ".join(cell_texts)
                 cell_value = self._parse_value(cell_value.strip(), col_def.get("data_type", "text"))
                 row_cells.append(cell_value)
@@ -393,9 +431,9 @@ class SpatialTableExtractor:
         return rows
 
     def _extract_text_elements(self, shapes: list[ShapeData],
-                                extraction_config: dict) -> dict[str, str]:
+                                extraction_config: dict[str, Any]) -> dict[str, str]:
         """Extract non-table text elements (title, subtitle, annotation)."""
-        elements = {}
+        elements: dict[str, str] = {}
         rules = extraction_config.get("rules", [])
 
         for rule in rules:
@@ -432,7 +470,7 @@ class SpatialTableExtractor:
 
         if data_type == "number":
             # Check WIP markers
-            if value.upper() in [m.upper() for m in self.wip_markers]:
+            if value.upper() in self._wip_markers_upper:
                 return value  # Keep as-is
 
             # Strip unit patterns
@@ -459,7 +497,7 @@ class SpatialTableExtractor:
 # Template matcher
 # ---------------------------------------------------------------------------
 
-def match_templates(slide: Any, templates: list[dict[str, Any]]) -> list[tuple[dict, float]]:
+def match_templates(slide: Any, templates: list[dict[str, Any]]) -> list[tuple[dict[str, Any], float]]:
     """Try all available metadata templates against a slide and return ranked matches.
 
     Args:
@@ -469,11 +507,11 @@ def match_templates(slide: Any, templates: list[dict[str, Any]]) -> list[tuple[d
     Returns:
         List of (template, confidence) tuples, sorted by confidence descending
     """
-    matches = []
+    matches: list[tuple[dict[str, Any], float]] = []
     for tmpl in templates:
         slides_def = tmpl.get("slides", [])
+        extractor = SpatialTableExtractor(tmpl)
         for slide_def in slides_def:
-            extractor = SpatialTableExtractor(tmpl)
             score = extractor.try_match_slide(slide, slide_def)
             if score > 0.2:
                 matches.append((tmpl, score))
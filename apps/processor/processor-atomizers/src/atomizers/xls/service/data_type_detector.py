@@ -28,6 +28,11 @@ CURRENCY: Final[re.Pattern[str]] = re.compile(
     re.IGNORECASE,
 )
 
+# Trailing currency code, required when no leading currency symbol is present
+CURRENCY_SUFFIX: Final[re.Pattern[str]] = re.compile(
+    r"(K\u010d|CZK|USD|EUR|GBP)\s*$", re.IGNORECASE
+)
+
 # Date patterns
 DATE_PATTERNS: Final[list[re.Pattern[str]]] = [
     re.compile(r"^\d{4}-\d{2}-\d{2}"),  # ISO: 2024-01-15
@@ -96,9 +101,7 @@ class DataTypeDetector:
         if not CURRENCY.match(value):
             return False
         has_symbol = any(c in value for c in "$\u20ac\u00a3\u00a5")
-        has_suffix = bool(
-            re.search(r"(K\u010d|CZK|USD|EUR|GBP)\s*$", value, re.IGNORECASE)
-        )
+        has_suffix = bool(CURRENCY_SUFFIX.search(value))
         return has_symbol or has_suffix
 
     @staticmethod
@@ -139,17 +139,17 @@ class ExcelParser:
                 rows=[],
             )
 
-        headers: list[str] = []
-        for col_idx in range(1, max_col + 1):
-            cell_value = ws.cell(row=1, column=col_idx).value
-            headers.append(self._cell_to_str(cell_value))
+        # One sequential sweep over the sheet's values instead of a
+        # ws.cell() lookup (and Cell round-trip) per coordinate
+        value_rows = ws.iter_rows(
+            min_row=1, max_row=max_row, min_col=1, max_col=max_col, values_only=True,
+        )
+        to_str = self._cell_to_str
+        headers: list[str] = list(map(to_str, next(value_rows)))
 
         rows: list[SheetRowData] = []
-        for row_idx in range(2, max_row + 1):
-            cells: list[str] = []
-            for col_idx in range(1, max_col + 1):
-                cell_value = ws.cell(row=row_idx, column=col_idx).value
-                cells.append(self._cell_to_str(cell_value))
+        for row_idx, values in enumerate(value_rows, start=2):
+            cells: list[str] = list(map(to_str, values))
 
             non_empty_count = sum(1 for c in cells if c.strip())
             if non_empty_count <= self._empty_row_threshold:
@@ -171,13 +171,16 @@ class ExcelAtomizerService(excel_pb2_grpc.ExcelAtomizerServiceServicer):
         if not headers:
             return []
 
-        data_types: list[excel_pb2.ColumnDataType] = []
-        for col_idx, header in enumerate(headers):
-            column_values: list[str] = []
-            for row in rows:
-                if col_idx < len(row.cells):
-                    column_values.append(row.cells[col_idx])
+        # Transpose once into per-column lists instead of re-walking every
+        # row for each header.
+        columns: list[list[str]] = [[] for _ in headers]
+        col_count = len(headers)
+        for row in rows:
+            for col_idx, cell in enumerate(row.cells[:col_count]):
+                columns[col_idx].append(cell)
 
+        data_types: list[excel_pb2.ColumnDataType] = []
+        for col_idx, (header, column_values) in enumerate(zip(headers, columns)):
             detected_type = self._type_detector.detect_column_type(column_values)
             data_types.append(
                 excel_pb2.ColumnDataType(
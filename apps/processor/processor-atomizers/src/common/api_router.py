@@ -11,7 +11,7 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
@@ -33,6 +33,8 @@ def init_settings(settings: Settings) -> None:
 
 _metadata_cache: list[dict[str, Any]] | None = None
 _metadata_cache_time: float = 0
+# Parsed template per file, keyed by path and invalidated on (mtime, size) change
+_metadata_file_cache: dict[Path, tuple[tuple[int, int], dict[str, Any] | None]] = {}
 
 
 def _load_metadata_templates() -> list[dict[str, Any]]:
@@ -63,12 +65,24 @@ def _load_metadata_templates() -> list[dict[str, Any]]:
             continue
         for json_file in search_dir.glob("*metadata*.json"):
             try:
+                stat = json_file.stat()
+                file_key = (stat.st_mtime_ns, stat.st_size)
+                cached = _metadata_file_cache.get(json_file)
+                if cached is not None and cached[0] == file_key:
+                    # Unchanged since last load -- skip re-reading and re-parsing
+                    if cached[1] is not None:
+                        templates.append(cached[1])
+                    continue
+
                 with open(json_file, "r", encoding="utf-8") as f:
                     tmpl = json.load(f)
                 if "slides" in tmpl:
                     templates.append(tmpl)
+                    _metadata_file_cache[json_file] = (file_key, tmpl)
                     logger.info("Loaded metadata template: %s (%s)",
                                 tmpl.get("name", json_file.name), json_file)
+                else:
+                    _metadata_file_cache[json_file] = (file_key, None)
             except Exception as e:
                 logger.warning("Failed to load metadata template %s: %s", json_file, e)
 
@@ -311,6 +325,19 @@ async def extract_excel(req: ExtractRequest) -> dict[str, Any]:
     }
 
 
+# Upper-cased extensions / MIME types routed to each parser by _try_extract
+_PPTX_FILE_TYPES: Final[frozenset[str]] = frozenset({
+    "PPTX", "PPT", "POWERPOINT",
+    "APPLICATION/VND.OPENXMLFORMATS-OFFICEDOCUMENT.PRESENTATIONML.PRESENTATION",
+    "APPLICATION/VND.MS-POWERPOINT",
+})
+_EXCEL_FILE_TYPES: Final[frozenset[str]] = frozenset({
+    "XLSX", "XLS", "EXCEL", "CSV",
+    "APPLICATION/VND.OPENXMLFORMATS-OFFICEDOCUMENT.SPREADSHEETML.SHEET",
+    "APPLICATION/VND.MS-EXCEL", "TEXT/CSV",
+})
+
+
 async def _try_extract(file_id: str, file_type: str = "", blob_url: str = "") -> dict[str, Any]:
     """Attempt to extract content from a file by routing to the appropriate parser.
 
@@ -323,18 +350,11 @@ async def _try_extract(file_id: str, file_type: str = "", blob_url: str = "") ->
     # Route to the correct parser based on file type (extension or MIME type)
     ft_upper = file_type.upper()
 
-    pptx_types = {"PPTX", "PPT", "POWERPOINT"}
-    excel_types = {"XLSX", "XLS", "EXCEL", "CSV"}
-    pptx_mimes = {"APPLICATION/VND.OPENXMLFORMATS-OFFICEDOCUMENT.PRESENTATIONML.PRESENTATION",
-                   "APPLICATION/VND.MS-POWERPOINT"}
-    excel_mimes = {"APPLICATION/VND.OPENXMLFORMATS-OFFICEDOCUMENT.SPREADSHEETML.SHEET",
-                    "APPLICATION/VND.MS-EXCEL", "TEXT/CSV"}
-
-    if ft_upper in pptx_types or ft_upper in pptx_mimes:
+    if ft_upper in _PPTX_FILE_TYPES:
         logger.info("Routing file %s to PPTX parser", file_id)
         return await extract_pptx(extract_req)
 
-    if ft_upper in excel_types or ft_upper in excel_mimes:
+    if ft_upper in _EXCEL_FILE_TYPES:
         logger.info("Routing file %s to Excel parser", file_id)
         return await extract_excel(extract_req)
 
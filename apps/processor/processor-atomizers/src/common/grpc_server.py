@@ -31,11 +31,16 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-async def create_grpc_server(settings: "Settings") -> grpc.aio.Server:
+async def create_grpc_server(
+    settings: "Settings",
+    ai_servicer: AiGatewayGrpcService | None = None,
+) -> grpc.aio.Server:
     """Create and configure a gRPC server with all atomizer services registered.
 
     Args:
         settings: Application settings.
+        ai_servicer: AI Gateway servicer to register. Pass one in when the
+            caller needs to close its HTTP clients on shutdown.
 
     Returns:
         A configured (but not yet started) gRPC async server.
@@ -71,7 +76,8 @@ async def create_grpc_server(settings: "Settings") -> grpc.aio.Server:
     logger.info("Registered ServiceNowAtomizerService")
 
     # AI Gateway
-    ai_servicer = AiGatewayGrpcService(settings)
+    if ai_servicer is None:
+        ai_servicer = AiGatewayGrpcService(settings)
     ai_pb2_grpc.add_AiGatewayServiceServicer_to_server(ai_servicer, server)
     logger.info("Registered AiGatewayGrpcService")
 
@@ -15,6 +15,7 @@ from typing import AsyncIterator
 import uvicorn
 from fastapi import FastAPI
 
+from src.atomizers.ai.service.ai_gateway_grpc import AiGatewayGrpcService
 from src.common.config import Settings
 from src.common.grpc_server import create_grpc_server
 from src.common.api_router import api_router, init_settings as init_api_settings
@@ -31,7 +32,8 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Manage startup and shutdown of gRPC server and cleanup scheduler."""
     # Start gRPC server
-    grpc_server = await create_grpc_server(settings)
+    ai_servicer = AiGatewayGrpcService(settings)
+    grpc_server = await create_grpc_server(settings, ai_servicer=ai_servicer)
     await grpc_server.start()
     logger.info("gRPC server started on port %d", settings.grpc_port)
 
@@ -47,6 +49,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Shutting down...")
     scheduler.shutdown(wait=False)
     await grpc_server.stop(grace=5)
+    await ai_servicer.close()
     logger.info("Shutdown complete")
 
 
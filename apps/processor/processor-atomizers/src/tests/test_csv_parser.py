@@ -0,0 +1,35 @@
+"""Unit tests for CsvParser."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.atomizers.csv.service.csv_parser import CsvParser
+
+
+@pytest.fixture(scope="module")
+def parser() -> CsvParser:
+    return CsvParser()
+
+
+class TestColumnTypes:
+    def test_numeric_column_with_na_placeholders(self, parser: CsvParser) -> None:
+        content = b"name,amount\nA,10\nB,N/A\nC,20.5\nD,NA\nE,null\n"
+        result = parser.parse(content)
+        assert result.data_types == ["STRING", "NUMBER"]
+
+    def test_date_column_with_empty_cells(self, parser: CsvParser) -> None:
+        content = b"name,due\nA,2024-01-31\nB,\nC,2024-02-29\nD,2024-03-31\n"
+        result = parser.parse(content)
+        assert result.data_types == ["STRING", "DATE"]
+
+    def test_placeholder_only_column_is_string(self, parser: CsvParser) -> None:
+        content = b"name,note\nA,N/A\nB,None\n"
+        result = parser.parse(content)
+        assert result.data_types == ["STRING", "STRING"]
+
+    def test_cells_are_kept_as_read(self, parser: CsvParser) -> None:
+        content = b"name,amount\nA,N/A\nB,10\n"
+        result = parser.parse(content)
+        assert result.headers == ["name", "amount"]
+        assert result.rows == [["A", "N/A"], ["B", "10"]]
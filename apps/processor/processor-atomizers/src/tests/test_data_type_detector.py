@@ -14,7 +14,7 @@ from src.atomizers.xls.service.data_type_detector import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def detector() -> DataTypeDetector:
     return DataTypeDetector()
 
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from src.atomizers.ai.client.dapr_client import StateConflictError
 from src.atomizers.ai.service.quota_service import QuotaService
 
 
@@ -47,7 +48,7 @@ async def test_record_usage_increments_counter(
     quota_service: QuotaService,
     mock_state_client: AsyncMock,
 ) -> None:
-    mock_state_client.get_state.return_value = {"tokens_used": 500}
+    mock_state_client.get_state_with_etag.return_value = ({"tokens_used": 500}, "7")
 
     status = await quota_service.record_usage(
         org_id="org-1",
@@ -60,13 +61,14 @@ async def test_record_usage_increments_counter(
     mock_state_client.save_state.assert_called_once()
     saved_value = mock_state_client.save_state.call_args[0][1]
     assert saved_value["tokens_used"] == 600
+    assert mock_state_client.save_state.call_args.kwargs["etag"] == "7"
 
 
 async def test_record_usage_from_zero(
     quota_service: QuotaService,
     mock_state_client: AsyncMock,
 ) -> None:
-    mock_state_client.get_state.return_value = None
+    mock_state_client.get_state_with_etag.return_value = (None, None)
 
     status = await quota_service.record_usage(
         org_id="org-new",
@@ -78,3 +80,26 @@ async def test_record_usage_from_zero(
     assert status.tokens_used_month == 250
     saved_value = mock_state_client.save_state.call_args[0][1]
     assert saved_value["tokens_used"] == 250
+
+
+async def test_record_usage_retries_on_conflict(
+    quota_service: QuotaService,
+    mock_state_client: AsyncMock,
+) -> None:
+    mock_state_client.get_state_with_etag.side_effect = [
+        ({"tokens_used": 500}, "1"),
+        ({"tokens_used": 800}, "2"),
+    ]
+    mock_state_client.save_state.side_effect = [StateConflictError("conflict"), None]
+
+    status = await quota_service.record_usage(
+        org_id="org-1",
+        user_id="user-1",
+        tokens_used=100,
+        model="gemma",
+    )
+
+    assert status.tokens_used_month == 900
+    assert mock_state_client.save_state.call_count == 2
+    saved_value = mock_state_client.save_state.call_args[0][1]
+    assert saved_value["tokens_used"] == 900
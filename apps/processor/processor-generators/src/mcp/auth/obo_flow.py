@@ -7,7 +7,6 @@ The AI agent never gets global access -- always scoped to user's permissions.
 from __future__ import annotations
 
 import logging
-import time
 from dataclasses import dataclass
 
 import httpx
@@ -24,7 +23,6 @@ _JWKS_URI = f"https://login.microsoftonline.com/{AZURE_TENANT_ID}/v2.0/.well-kno
 # JWKS cache with 5-minute TTL as per spec
 _JWKS_CACHE_TTL = 300  # seconds
 _jwks_client: PyJWKClient | None = None
-_jwks_cache_time: float = 0
 
 
 @dataclass(frozen=True, slots=True)
@@ -38,20 +36,21 @@ class TokenClaims:
 
 
 def _get_jwks_client() -> PyJWKClient | None:
-    """Get or create JWKS client with caching.
+    """Get or lazily create the process-wide JWKS client.
 
-    Returns cached client if within TTL, otherwise creates new one.
+    Only constructed in production mode (AZURE_CLIENT_ID set). The client
+    refreshes its cached key set itself every ``_JWKS_CACHE_TTL`` seconds, so
+    a single instance is kept instead of being rebuilt (and its cache
+    discarded) on every TTL expiry.
     """
-    global _jwks_client, _jwks_cache_time
+    global _jwks_client
 
     if not AZURE_CLIENT_ID:
         return None
 
-    current_time = time.time()
-    if _jwks_client is None or (current_time - _jwks_cache_time) > _JWKS_CACHE_TTL:
+    if _jwks_client is None:
         try:
-            _jwks_client = PyJWKClient(_JWKS_URI, lifespan=_JWKS_CACHE_TTL)
-            _jwks_cache_time = current_time
+            _jwks_client = PyJWKClient(_JWKS_URI, cache_jwk_set=True, lifespan=_JWKS_CACHE_TTL)
             logger.info("JWKS client initialized with URI: %s", _JWKS_URI)
         except PyJWKClientError as e:
             logger.error("Failed to initialize JWKS client: %s", e)
@@ -60,41 +59,37 @@ def _get_jwks_client() -> PyJWKClient | None:
     return _jwks_client
 
 
-def validate_token(token: str) -> TokenClaims:
-    """Validate a JWT access token and extract claims.
+def _validate_dev_token(token: str) -> TokenClaims:
+    """Local dev mode (no AZURE_CLIENT_ID): accept any token.
 
-    In local dev mode (no AZURE_CLIENT_ID), uses a simplified validation
-    that accepts any well-formed JWT.
+    Well-formed JWTs are decoded without verification so their claims can
+    still drive RLS; anything else maps to the dev identity.
+    """
+    try:
+        payload = jwt.decode(token, options={"verify_signature": False})
+        return TokenClaims(
+            user_id=payload.get("oid", payload.get("sub", "dev-user")),
+            org_id=payload.get("tid", payload.get("org_id", "dev-org")),
+            roles=payload.get("roles", ["admin"]),
+            name=payload.get("name", "Dev User"),
+        )
+    except jwt.DecodeError:
+        # Accept placeholder tokens in dev mode
+        logger.debug("Dev mode: accepting token without validation")
+        return TokenClaims(
+            user_id="dev-user",
+            org_id="dev-org",
+            roles=["admin"],
+            name="Dev User",
+        )
 
-    Args:
-        token: Bearer token from the request.
 
-    Returns:
-        TokenClaims with user identity and permissions.
+def _validate_entra_token(token: str) -> TokenClaims:
+    """Production mode: validate against Azure Entra ID signing keys.
 
     Raises:
         ValueError: If the token is invalid or expired.
     """
-    if not AZURE_CLIENT_ID:
-        # Local dev bypass: decode without verification
-        try:
-            payload = jwt.decode(token, options={"verify_signature": False})
-            return TokenClaims(
-                user_id=payload.get("oid", payload.get("sub", "dev-user")),
-                org_id=payload.get("tid", payload.get("org_id", "dev-org")),
-                roles=payload.get("roles", ["admin"]),
-                name=payload.get("name", "Dev User"),
-            )
-        except jwt.DecodeError:
-            # Accept placeholder tokens in dev mode
-            logger.debug("Dev mode: accepting token without validation")
-            return TokenClaims(
-                user_id="dev-user",
-                org_id="dev-org",
-                roles=["admin"],
-                name="Dev User",
-            )
-
     try:
         # Production: validate with Azure Entra ID public keys via JWKS
         jwks_client = _get_jwks_client()
@@ -144,6 +139,26 @@ def validate_token(token: str) -> TokenClaims:
         raise ValueError(f"Invalid token: {e}") from e
 
 
+def validate_token(token: str) -> TokenClaims:
+    """Validate a JWT access token and extract claims.
+
+    In local dev mode (no AZURE_CLIENT_ID), uses a simplified validation
+    that accepts any well-formed JWT.
+
+    Args:
+        token: Bearer token from the request.
+
+    Returns:
+        TokenClaims with user identity and permissions.
+
+    Raises:
+        ValueError: If the token is invalid or expired.
+    """
+    if not AZURE_CLIENT_ID:
+        return _validate_dev_token(token)
+    return _validate_entra_token(token)
+
+
 async def exchange_token_obo(user_token: str) -> str:
     """Exchange a user's access token for a downstream API token via OBO flow.
 
@@ -11,6 +11,32 @@ from src.mcp.tools.query_opex import query_opex_data
 from src.mcp.tools.report_status import get_report_status
 from src.mcp.tools.compare_periods import compare_periods
 
+# Canned DB rows shared by reference; the tools copy each row with dict(row)
+# before touching it, so the templates are never mutated.
+_OPEX_ROWS = [
+    {
+        "file_id": "file-1",
+        "source_sheet": "Sheet1",
+        "headers": ["Cost", "Date"],
+        "metadata": {"period": "2024-Q1"},
+        "created_at": datetime(2024, 3, 15, tzinfo=timezone.utc),
+    }
+]
+
+_REPORT_STATUS_ROWS = [
+    {
+        "form_version_id": "form-v1",
+        "fields_submitted": 10,
+        "first_submitted": datetime(2024, 3, 1, tzinfo=timezone.utc),
+        "last_submitted": datetime(2024, 3, 5, tzinfo=timezone.utc),
+    }
+]
+
+_COMPARE_ROWS = [
+    {"period": "2024-Q1", "record_count": 50, "source_sheet": "Sheet1"},
+    {"period": "2024-Q2", "record_count": 75, "source_sheet": "Sheet1"},
+]
+
 
 @pytest.fixture
 def mock_db() -> AsyncMock:
@@ -19,15 +45,7 @@ def mock_db() -> AsyncMock:
 
 async def test_query_opex_data_returns_results(mock_db: AsyncMock) -> None:
     """query_opex_data returns filtered data."""
-    mock_db.execute_with_rls.return_value = [
-        {
-            "file_id": "file-1",
-            "source_sheet": "Sheet1",
-            "headers": ["Cost", "Date"],
-            "metadata": {"period": "2024-Q1"},
-            "created_at": datetime(2024, 3, 15, tzinfo=timezone.utc),
-        }
-    ]
+    mock_db.execute_with_rls.return_value = _OPEX_ROWS
 
     result = await query_opex_data(mock_db, "org-1", period="2024-Q1")
 
@@ -48,14 +66,7 @@ async def test_query_opex_data_empty_result(mock_db: AsyncMock) -> None:
 
 async def test_get_report_status(mock_db: AsyncMock) -> None:
     """get_report_status returns submission matrix."""
-    mock_db.execute_with_rls.return_value = [
-        {
-            "form_version_id": "form-v1",
-            "fields_submitted": 10,
-            "first_submitted": datetime(2024, 3, 1, tzinfo=timezone.utc),
-            "last_submitted": datetime(2024, 3, 5, tzinfo=timezone.utc),
-        }
-    ]
+    mock_db.execute_with_rls.return_value = _REPORT_STATUS_ROWS
 
     result = await get_report_status(mock_db, "org-1", "2024-Q1")
 
@@ -66,10 +77,7 @@ async def test_get_report_status(mock_db: AsyncMock) -> None:
 
 async def test_compare_periods(mock_db: AsyncMock) -> None:
     """compare_periods returns delta analysis."""
-    mock_db.execute_with_rls.return_value = [
-        {"period": "2024-Q1", "record_count": 50, "source_sheet": "Sheet1"},
-        {"period": "2024-Q2", "record_count": 75, "source_sheet": "Sheet1"},
-    ]
+    mock_db.execute_with_rls.return_value = _COMPARE_ROWS
 
     result = await compare_periods(mock_db, "org-1", "2024-Q1", "2024-Q2")
 
@@ -7,7 +7,7 @@ from openpyxl import Workbook, load_workbook
 from src.generators.xls.service.sheet_updater import SheetUpdater, MAX_INPUT_SIZE_BYTES
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def updater():
     return SheetUpdater()
 
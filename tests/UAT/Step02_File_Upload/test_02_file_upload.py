@@ -33,8 +33,12 @@ TEST_FILES = {
     },
 }
 
+PPTX_MIME = TEST_FILES["pptx"]["mime"]
+
 # Fake EXE blob for rejection test
 FAKE_EXE = b"MZ" + b"\x00" * 100
+# Minimal zip-magic payload posing as a PPTX (auth tests; never parsed)
+FAKE_PPTX_BYTES = b"PK\x03\x04" + b"\x00" * 50
 CSV_BYTES = b"Project,Cost\nItem1,100\nItem2,250\n"
 PDF_BYTES = b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog >>\nendobj\n%%EOF\n"
 EICAR_BYTES = (
@@ -194,8 +198,7 @@ def main() -> int:
                                 tag="upload-exe-rejected",
                                 timeout=TIMEOUTS.get("upload", 60))
 
-    spoofed_pptx = ("spoofed.pptx", io.BytesIO(FAKE_EXE),
-                    "application/vnd.openxmlformats-officedocument.presentationml.presentation")
+    spoofed_pptx = ("spoofed.pptx", io.BytesIO(FAKE_EXE), PPTX_MIME)
     upload_session.call_status_in("POST", "/api/upload",
                                 files={"file": spoofed_pptx},
                                 body={"upload_purpose": "PARSE"},
@@ -218,8 +221,7 @@ def main() -> int:
     # 5. Upload without auth — expect 401/403 (in dev mode may accept)
     # ---------------------------------------------------------------
     noauth_session = UATSession(base_url=upload_url)  # no token, no api_key, no X-headers
-    noauth_file = ("noauth.pptx", io.BytesIO(b"PK\x03\x04" + b"\x00" * 50),
-                   "application/vnd.openxmlformats-officedocument.presentationml.presentation")
+    noauth_file = ("noauth.pptx", io.BytesIO(FAKE_PPTX_BYTES), PPTX_MIME)
     noauth_session.call_status_in("POST", "/api/upload",
                                 files={"file": noauth_file},
                                 expected_statuses=(401, 403, 400),
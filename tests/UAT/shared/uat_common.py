@@ -46,6 +46,9 @@ class UATSession:
         self._error_lines: list[str] = []
         # Use lists as mutable containers so for_service() can share counters
         self._counters = [0, 0, 0]  # [pass_count, fail_count, skip_count]
+        # One pooled HTTP session per step (keep-alive connections are reused
+        # across calls; shared with for_service() copies)
+        self._http = requests.Session()
 
         os.makedirs(self.logs_dir, exist_ok=True)
 
@@ -152,6 +155,7 @@ class UATSession:
         s._log_lines = self._log_lines
         s._error_lines = self._error_lines
         s._counters = self._counters  # shared mutable list
+        s._http = self._http
         return s
 
     def sync_counters_from(self, other: 'UATSession') -> None:
@@ -192,7 +196,7 @@ class UATSession:
         self._log(f"[CALL] GET {url} (dev bypass / auth check for {email})")
 
         try:
-            resp = requests.get(url, headers={"Authorization": "Bearer dev-bypass-token"}, timeout=30)
+            resp = self._http.get(url, headers={"Authorization": "Bearer dev-bypass-token"}, timeout=30)
             data = _try_json(resp)
             self._log(f"[RES]  {resp.status_code} {json.dumps(data)[:300]}")
 
@@ -261,18 +265,18 @@ class UATSession:
 
         try:
             if files:
-                resp = requests.request(
+                resp = self._http.request(
                     method, url, files=files, data=body or {},
                     headers=headers, timeout=timeout, params=query_params
                 )
             elif body is not None:
                 headers["Content-Type"] = "application/json"
-                resp = requests.request(
+                resp = self._http.request(
                     method, url, json=body,
                     headers=headers, timeout=timeout, params=query_params
                 )
             else:
-                resp = requests.request(
+                resp = self._http.request(
                     method, url, headers=headers, timeout=timeout, params=query_params
                 )
 
@@ -1,6 +1,4 @@
 import sys
-import os
-import statistics
 sys.path.append("backend")
 from app.services.parsers.ppt_shapes import PseudoTableParser
 